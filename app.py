@@ -1,12 +1,86 @@
-from flask import Flask, request, jsonify, render_template
+from flask import Flask, Response, request, render_template
 from flask_cors import CORS
-from src.algorithms import Graph, dijkstra, astar, PathResult
-import time
+from src.algorithms import Graph, dijkstra, bidijkstra, astar, PathResult, DistanceResult
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
+from threading import Lock
+from typing import Annotated, List, Literal, Union
+from typing_extensions import NotRequired, TypedDict
+from pydantic import Field, StrictFloat, StrictInt, StrictStr, TypeAdapter, ValidationError
+import hashlib
+import orjson
 
 app = Flask(__name__)
 CORS(app)
 
-app.config['JSON_SORT_KEYS'] = False
+# The search kernels release the GIL, so /compare runs its three searches in
+# parallel. Shared across requests to avoid spawning threads per call.
+compare_executor = ThreadPoolExecutor(max_workers=3, thread_name_prefix='compare')
+
+
+def ojsonify(obj, status: int = 200) -> Response:
+    return Response(orjson.dumps(obj), status=status, mimetype='application/json')
+
+
+# Request shapes are TypedDicts validated through module-level TypeAdapters:
+# pydantic checks the whole payload in one pass and hands back plain dicts,
+# without building a model instance per node and per edge. Ids keep the type
+# the caller sent, so numeric ids come back numeric in paths; strict members
+# let the union settle on the exact match without trying lax conversions.
+NodeId = Union[StrictStr, StrictInt, StrictFloat]
+
+# The searches assume non-negative, finite weights; a negative edge can turn the
+# predecessor chain into a cycle that the path walk never leaves.
+EdgeWeight = Annotated[float, Field(ge=0, allow_inf_nan=False)]
+
+
+class NodeDict(TypedDict):
+    id: NodeId
+    x: NotRequired[float]
+    y: NotRequired[float]
+
+
+EdgeDict = TypedDict('EdgeDict', {
+    'from': NodeId,
+    'to': NodeId,
+    'weight': NotRequired[EdgeWeight],
+    'bidirectional': NotRequired[bool]
+})
+
+
+class GraphDict(TypedDict):
+    nodes: NotRequired[List[Union[NodeDict, NodeId]]]
+    edges: NotRequired[List[EdgeDict]]
+
+
+class PathRequest(TypedDict):
+    graph: GraphDict
+    start: NodeId
+    end: NodeId
+
+
+class AStarRequest(PathRequest):
+    heuristic: NotRequired[Literal['euclidean', 'manhattan']]
+
+
+path_request_adapter = TypeAdapter(PathRequest)
+astar_request_adapter = TypeAdapter(AStarRequest)
+
+
+def validation_error(e: ValidationError) -> Response:
+    return ojsonify({
+        "error": "Invalid request body",
+        "details": e.errors(include_url=False, include_context=False, include_input=False)
+    }, 400)
+
+
+def distance_to_dict(result: DistanceResult) -> dict:
+    distance, nodes_explored, execution_time_ms = result
+    return {
+        "distance": distance,
+        "nodes_explored": nodes_explored,
+        "execution_time_ms": execution_time_ms
+    }
 
 
 def result_to_dict(result: PathResult) -> dict:
@@ -19,6 +93,31 @@ def result_to_dict(result: PathResult) -> dict:
     }
 
 
+# Finalized graphs keyed by a digest of the validated graph, so re-posting the
+# same graph (the common case while clicking around the visualizer) skips
+# construction entirely. Hashing the serialized payload is far cheaper than
+# building a hashable canonical form of it, and only the digest is retained.
+GRAPH_CACHE_SIZE = 64
+_graph_cache: 'OrderedDict[bytes, Graph]' = OrderedDict()
+_graph_cache_lock = Lock()
+
+
+def load_graph(graph: GraphDict) -> Graph:
+    key = hashlib.blake2b(orjson.dumps(graph), digest_size=16).digest()
+    with _graph_cache_lock:
+        cached = _graph_cache.get(key)
+        if cached is not None:
+            _graph_cache.move_to_end(key)
+            return cached
+    
+    built = Graph.from_dict(graph).finalize()
+    with _graph_cache_lock:
+        _graph_cache[key] = built
+        if len(_graph_cache) > GRAPH_CACHE_SIZE:
+            _graph_cache.popitem(last=False)
+    return built
+
+
 @app.route('/')
 def index():
     return render_template('index.html')
@@ -26,7 +125,7 @@ def index():
 
 @app.route('/api/health', methods=['GET'])
 def health():
-    return jsonify({
+    return ojsonify({
         "status": "healthy",
         "service": "Pathfinding API",
         "version": "1.0.0"
@@ -36,129 +135,141 @@ def health():
 @app.route('/api/pathfind/dijkstra', methods=['POST'])
 def find_path_dijkstra():
     try:
-        data = request.get_json()
+        req = path_request_adapter.validate_python(request.get_json())
         
-        if not data:
-            return jsonify({"error": "No JSON data provided"}), 400
+        graph = load_graph(req['graph'])
+        start = req['start']
+        end = req['end']
         
-        required_fields = ['graph', 'start', 'end']
-        for field in required_fields:
-            if field not in data:
-                return jsonify({"error": f"Missing required field: {field}"}), 400
+        output = "distance" if request.args.get('only') == 'distance' else "full"
+        result = dijkstra(graph, start, end, output)
         
-        graph = Graph.from_dict(data['graph'])
-        start = data['start']
-        end = data['end']
+        if result is None:
+            return ojsonify({
+                "error": "No path found",
+                "start": start,
+                "end": end
+            }, 404)
+        
+        return ojsonify({
+            "success": True,
+            "result": distance_to_dict(result) if output == "distance" else result_to_dict(result)
+        })
+    
+    except ValidationError as e:
+        return validation_error(e)
+    
+    except Exception as e:
+        return ojsonify({"error": str(e)}, 500)
+
+
+@app.route('/api/pathfind/bidijkstra', methods=['POST'])
+def find_path_bidijkstra():
+    try:
+        req = path_request_adapter.validate_python(request.get_json())
+        
+        graph = load_graph(req['graph'])
+        start = req['start']
+        end = req['end']
         
-        result = dijkstra(graph, start, end)
+        output = "distance" if request.args.get('only') == 'distance' else "full"
+        result = bidijkstra(graph, start, end, output)
         
         if result is None:
-            return jsonify({
+            return ojsonify({
                 "error": "No path found",
                 "start": start,
                 "end": end
-            }), 404
+            }, 404)
         
-        return jsonify({
+        return ojsonify({
             "success": True,
-            "result": result_to_dict(result)
+            "result": distance_to_dict(result) if output == "distance" else result_to_dict(result)
         })
     
+    except ValidationError as e:
+        return validation_error(e)
+    
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return ojsonify({"error": str(e)}, 500)
 
 
 @app.route('/api/pathfind/astar', methods=['POST'])
 def find_path_astar():
     try:
-        data = request.get_json()
-        
-        if not data:
-            return jsonify({"error": "No JSON data provided"}), 400
-        
-        required_fields = ['graph', 'start', 'end']
-        for field in required_fields:
-            if field not in data:
-                return jsonify({"error": f"Missing required field: {field}"}), 400
-        
-        graph = Graph.from_dict(data['graph'])
-        start = data['start']
-        end = data['end']
-        heuristic = data.get('heuristic', 'euclidean')
+        req = astar_request_adapter.validate_python(request.get_json())
         
-        if heuristic not in ['euclidean', 'manhattan']:
-            return jsonify({"error": "Invalid heuristic. Use 'euclidean' or 'manhattan'"}), 400
+        graph = load_graph(req['graph'])
+        start = req['start']
+        end = req['end']
         
-        result = astar(graph, start, end, heuristic)
+        output = "distance" if request.args.get('only') == 'distance' else "full"
+        result = astar(graph, start, end, req.get('heuristic', 'euclidean'), output)
         
         if result is None:
-            return jsonify({
+            return ojsonify({
                 "error": "No path found",
                 "start": start,
                 "end": end
-            }), 404
+            }, 404)
         
-        return jsonify({
+        return ojsonify({
             "success": True,
-            "result": result_to_dict(result)
+            "result": distance_to_dict(result) if output == "distance" else result_to_dict(result)
         })
     
+    except ValidationError as e:
+        return validation_error(e)
+    
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return ojsonify({"error": str(e)}, 500)
 
 
 @app.route('/api/pathfind/compare', methods=['POST'])
 def compare_algorithms():
     try:
-        data = request.get_json()
-        
-        if not data:
-            return jsonify({"error": "No JSON data provided"}), 400
+        req = path_request_adapter.validate_python(request.get_json())
         
-        required_fields = ['graph', 'start', 'end']
-        for field in required_fields:
-            if field not in data:
-                return jsonify({"error": f"Missing required field: {field}"}), 400
+        graph = load_graph(req['graph'])
+        start = req['start']
+        end = req['end']
         
-        graph = Graph.from_dict(data['graph'])
-        start = data['start']
-        end = data['end']
+        futures = {
+            'dijkstra': compare_executor.submit(dijkstra, graph, start, end),
+            'astar_euclidean': compare_executor.submit(astar, graph, start, end, 'euclidean'),
+            'astar_manhattan': compare_executor.submit(astar, graph, start, end, 'manhattan')
+        }
         
         results = {}
-        
-        dijkstra_result = dijkstra(graph, start, end)
-        if dijkstra_result:
-            results['dijkstra'] = result_to_dict(dijkstra_result)
-        
-        astar_euclidean = astar(graph, start, end, 'euclidean')
-        if astar_euclidean:
-            results['astar_euclidean'] = result_to_dict(astar_euclidean)
-        
-        astar_manhattan = astar(graph, start, end, 'manhattan')
-        if astar_manhattan:
-            results['astar_manhattan'] = result_to_dict(astar_manhattan)
+        for name, future in futures.items():
+            result = future.result()
+            if result:
+                results[name] = result_to_dict(result)
         
         if not results:
-            return jsonify({
+            return ojsonify({
                 "error": "No path found by any algorithm",
                 "start": start,
                 "end": end
-            }), 404
+            }, 404)
         
-        return jsonify({
+        return ojsonify({
             "success": True,
             "start": start,
             "end": end,
             "comparisons": results
         })
     
+    except ValidationError as e:
+        return validation_error(e)
+    
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return ojsonify({"error": str(e)}, 500)
 
 
 @app.route('/api/docs', methods=['GET'])
 def api_docs():
-    return jsonify({
+    return ojsonify({
         "name": "High-Performance Pathfinding API",
         "version": "1.0.0",
         "description": "REST API for graph pathfinding using Dijkstra's and A* algorithms",
@@ -172,6 +283,8 @@ def api_docs():
                 "path": "/api/pathfind/dijkstra",
                 "method": "POST",
                 "description": "Find shortest path using Dijkstra's algorithm",
+                "query": {"only": "distance (optional): omit the path, return distance, nodes_explored and execution_time_ms"},
+                "ids": "Node ids may be strings or numbers; paths return them as posted",
                 "body": {
                     "graph": {
                         "nodes": [{"id": "A", "x": 0, "y": 0}],
@@ -181,10 +294,16 @@ def api_docs():
                     "end": "B"
                 }
             },
+            {
+                "path": "/api/pathfind/bidijkstra",
+                "method": "POST",
+                "description": "Find shortest path using bidirectional Dijkstra (same body and query as dijkstra)"
+            },
             {
                 "path": "/api/pathfind/astar",
                 "method": "POST",
                 "description": "Find shortest path using A* algorithm",
+                "query": {"only": "distance (optional)"},
                 "body": {
                     "graph": {},
                     "start": "A",
@@ -195,11 +314,12 @@ def api_docs():
             {
                 "path": "/api/pathfind/compare",
                 "method": "POST",
-                "description": "Compare all algorithms on the same graph"
+                "description": "Compare dijkstra, astar_euclidean and astar_manhattan on the same graph"
             }
         ],
         "complexity": {
-            "dijkstra": "O((V + E) log V) with binary heap",
+            "dijkstra": "O((V + E) log V) with a 4-ary indexed heap",
+            "bidijkstra": "O((V + E) log V), typically settling about half the nodes of dijkstra",
             "astar": "O((V + E) log V) with heuristic optimization"
         }
     })
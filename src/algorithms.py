@@ -1,10 +1,17 @@
-import heapq
 import time
-from typing import Dict, List, Optional, Tuple, Callable
+from typing import Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass
 
+import numpy as np
+from numba import njit
 
-@dataclass
+# Every fast-math flag except 'nnan'/'ninf': unreached nodes are tracked as inf.
+_FASTMATH = {"nsz", "arcp", "contract", "afn", "reassoc"}
+
+_INF = np.inf
+
+
+@dataclass(slots=True, frozen=True)
 class PathResult:
     path: List[str]
     distance: float
@@ -13,31 +20,123 @@ class PathResult:
     algorithm: str
 
 
+# (distance, nodes_explored, execution_time_ms), returned for output="distance".
+DistanceResult = Tuple[float, int, float]
+
+
 class Graph:
+    __slots__ = (
+        'node_positions', 'finalized',
+        'id_by_index', 'index_by_id',
+        'edge_sources', 'edge_targets', 'edge_weights', 'edge_bidirectional',
+        'indptr', 'indices', 'weights',
+        'rindptr', 'rindices', 'rweights',
+        'xy'
+    )
+    
     def __init__(self):
-        self.adjacency_list: Dict[str, List[Tuple[str, float]]] = {}
         self.node_positions: Dict[str, Tuple[float, float]] = {}
+        self.id_by_index: List[str] = []
+        self.index_by_id: Dict[str, int] = {}
+        # Edges as added, one entry each; bidirectional ones are mirrored in finalize().
+        self.edge_sources: List[int] = []
+        self.edge_targets: List[int] = []
+        self.edge_weights: List[float] = []
+        self.edge_bidirectional: List[bool] = []
+        self.finalized = False
     
     def add_node(self, node_id: str, x: float = 0, y: float = 0):
-        if node_id not in self.adjacency_list:
-            self.adjacency_list[node_id] = []
+        if node_id not in self.index_by_id:
+            self.index_by_id[node_id] = len(self.id_by_index)
+            self.id_by_index.append(node_id)
         self.node_positions[node_id] = (x, y)
+        self.finalized = False
     
     def add_edge(self, from_node: str, to_node: str, weight: float, bidirectional: bool = True):
-        if from_node not in self.adjacency_list:
+        # One probe per endpoint on the common path where both nodes exist.
+        source = self.index_by_id.get(from_node)
+        if source is None:
             self.add_node(from_node)
-        if to_node not in self.adjacency_list:
+            source = self.index_by_id[from_node]
+        target = self.index_by_id.get(to_node)
+        if target is None:
             self.add_node(to_node)
+            target = self.index_by_id[to_node]
         
-        self.adjacency_list[from_node].append((to_node, weight))
-        if bidirectional:
-            self.adjacency_list[to_node].append((from_node, weight))
+        self.edge_sources.append(source)
+        self.edge_targets.append(target)
+        self.edge_weights.append(weight)
+        self.edge_bidirectional.append(bidirectional)
+        self.finalized = False
+    
+    @property
+    def adjacency_list(self) -> Dict[str, List[Tuple[str, float]]]:
+        return {node_id: self.get_neighbors(node_id) for node_id in self.id_by_index}
     
     def get_neighbors(self, node_id: str) -> List[Tuple[str, float]]:
-        return self.adjacency_list.get(node_id, [])
+        index = self.index_by_id.get(node_id)
+        if index is None:
+            return []
+        
+        self.finalize()
+        lo, hi = self.indptr[index], self.indptr[index + 1]
+        return [
+            (self.id_by_index[neighbor], weight)
+            for neighbor, weight in zip(self.indices[lo:hi].tolist(), self.weights[lo:hi].tolist())
+        ]
     
     def get_nodes(self) -> List[str]:
-        return list(self.adjacency_list.keys())
+        return list(self.id_by_index)
+    
+    def finalize(self) -> 'Graph':
+        """Pack the recorded edges into integer-indexed CSR arrays.
+        
+        The JIT kernels only see these arrays: the neighbours of node ``i`` are
+        ``indices[indptr[i]:indptr[i + 1]]`` with matching ``weights``, and its
+        position is ``xy[i]``. ``rindptr``/``rindices``/``rweights`` hold the
+        same edges reversed, for searches that also walk backwards from the
+        goal. Mutating the graph afterwards marks it dirty so the next search
+        rebuilds them.
+        """
+        if self.finalized:
+            return self
+        
+        n = len(self.id_by_index)
+        sources = np.array(self.edge_sources, dtype=np.int32)
+        targets = np.array(self.edge_targets, dtype=np.int32)
+        weights = np.array(self.edge_weights, dtype=np.float64)
+        mirrored = np.array(self.edge_bidirectional, dtype=np.bool_)
+        
+        # Bidirectional edges are stored once; add their reverse copies here in
+        # one vectorised pass instead of a second append per add_edge().
+        sources, targets = (
+            np.concatenate((sources, targets[mirrored])),
+            np.concatenate((targets, sources[mirrored]))
+        )
+        weights = np.concatenate((weights, weights[mirrored]))
+        
+        # Scatter edges into CSR order by a stable sort on one endpoint, once
+        # grouped by source (forward) and once by target (reverse).
+        order = np.argsort(sources, kind='stable')
+        indptr = np.zeros(n + 1, dtype=np.int32)
+        np.cumsum(np.bincount(sources, minlength=n), out=indptr[1:])
+        
+        rorder = np.argsort(targets, kind='stable')
+        rindptr = np.zeros(n + 1, dtype=np.int32)
+        np.cumsum(np.bincount(targets, minlength=n), out=rindptr[1:])
+        
+        self.indptr = indptr
+        self.indices = targets[order]
+        self.weights = weights[order]
+        self.rindptr = rindptr
+        self.rindices = sources[rorder]
+        self.rweights = weights[rorder]
+        self.xy = np.array(
+            [self.node_positions[node_id] for node_id in self.id_by_index],
+            dtype=np.float64
+        ).reshape(-1, 2)
+        self.finalized = True
+        return self
     
     @classmethod
     def from_dict(cls, data: dict) -> 'Graph':
@@ -64,153 +163,487 @@ class Graph:
         return graph
 
 
-def dijkstra(graph: Graph, start: str, end: str) -> Optional[PathResult]:
-    start_time = time.perf_counter()
+# The open-set heaps are 4-ary: half the depth of a binary heap, and the four
+# children of a node share a cache line of keys.
+@njit(cache=True)
+def _indexed_sift_up(keys, items, pos, i):
+    key = keys[i]
+    item = items[i]
+    while i > 0:
+        parent = (i - 1) >> 2
+        if keys[parent] <= key:
+            break
+        keys[i] = keys[parent]
+        items[i] = items[parent]
+        pos[items[i]] = i
+        i = parent
+    keys[i] = key
+    items[i] = item
+    pos[item] = i
+
+
+@njit(cache=True)
+def _indexed_sift_down(keys, items, pos, size, i):
+    key = keys[i]
+    item = items[i]
+    while True:
+        first = (i << 2) + 1
+        if first >= size:
+            break
+        child = first
+        last = min(first + 4, size)
+        for c in range(first + 1, last):
+            if keys[c] < keys[child]:
+                child = c
+        if keys[child] >= key:
+            break
+        keys[i] = keys[child]
+        items[i] = items[child]
+        pos[items[i]] = i
+        i = child
+    keys[i] = key
+    items[i] = item
+    pos[item] = i
+
+
+# pos[] doubles as the per-node search state, so kernels need no separate
+# visited/closed arrays to initialise: >= 0 is a heap slot, otherwise one of these.
+_UNSEEN = -1
+_SETTLED = -2
+
+
+# Relaxations push one item at a time on purpose. Deferring a node's new
+# neighbours and settling them with one Floyd heapify measured slower (even
+# expanding a 300k-edge hub): randomly keyed inserts sift up O(1) levels on
+# average, so the rebuild never pays for itself.
+@njit(cache=True)
+def _push_or_decrease(keys, items, pos, size, item, key):
+    """Insert ``item`` or lower its key in place; settled items are left alone."""
+    i = pos[item]
+    if i == _UNSEEN:
+        keys[size] = key
+        items[size] = item
+        _indexed_sift_up(keys, items, pos, size)
+        return size + 1
+    if i != _SETTLED and key < keys[i]:
+        keys[i] = key
+        _indexed_sift_up(keys, items, pos, i)
+    return size
+
+
+@njit(cache=True)
+def _pop_min(keys, items, pos, size):
+    key = keys[0]
+    item = items[0]
+    pos[item] = _SETTLED
+    size -= 1
+    if size > 0:
+        keys[0] = keys[size]
+        items[0] = items[size]
+        _indexed_sift_down(keys, items, pos, size, 0)
+    return key, item, size
+
+
+@njit(cache=True, nogil=True, fastmath=_FASTMATH)
+def _dijkstra_nb(indptr, indices, weights, n, s, t):
+    dist = np.full(n, _INF)
+    prev = np.full(n, -1, dtype=np.int32)
     
-    if start not in graph.adjacency_list or end not in graph.adjacency_list:
-        return None
+    # One heap slot per node: relaxing an open node decreases its key in place,
+    # and settled nodes can never be improved with non-negative weights.
+    keys = np.empty(n, dtype=np.float64)
+    items = np.empty(n, dtype=np.int32)
+    pos = np.full(n, _UNSEEN, dtype=np.int32)
+    dist[s] = 0.0
+    size = _push_or_decrease(keys, items, pos, 0, s, 0.0)
+    nodes_explored = 0
     
-    distances: Dict[str, float] = {node: float('inf') for node in graph.adjacency_list}
-    distances[start] = 0
-    previous: Dict[str, Optional[str]] = {node: None for node in graph.adjacency_list}
+    while size > 0:
+        current_distance, u, size = _pop_min(keys, items, pos, size)
+        nodes_explored += 1
+        
+        # Covers u == t, and stops early on ties: with non-negative weights
+        # nothing popped from here on can improve dist[t].
+        if current_distance >= dist[t]:
+            break
+        
+        for k in range(indptr[u], indptr[u + 1]):
+            v = indices[k]
+            distance = current_distance + weights[k]
+            
+            if distance < dist[v]:
+                dist[v] = distance
+                prev[v] = u
+                size = _push_or_decrease(keys, items, pos, size, v, distance)
     
-    priority_queue: List[Tuple[float, str]] = [(0, start)]
-    visited = set()
+    return dist[t], prev, nodes_explored
+
+
+@njit(cache=True, nogil=True, fastmath=_FASTMATH)
+def _bidijkstra_nb(indptr, indices, weights, rindptr, rindices, rweights, n, s, t):
+    dist_f = np.full(n, _INF)
+    dist_b = np.full(n, _INF)
+    prev_f = np.full(n, -1, dtype=np.int32)
+    next_b = np.full(n, -1, dtype=np.int32)
+    
+    keys_f = np.empty(n, dtype=np.float64)
+    items_f = np.empty(n, dtype=np.int32)
+    pos_f = np.full(n, _UNSEEN, dtype=np.int32)
+    keys_b = np.empty(n, dtype=np.float64)
+    items_b = np.empty(n, dtype=np.int32)
+    pos_b = np.full(n, _UNSEEN, dtype=np.int32)
+    
+    dist_f[s] = 0.0
+    dist_b[t] = 0.0
+    size_f = _push_or_decrease(keys_f, items_f, pos_f, 0, s, 0.0)
+    size_b = _push_or_decrease(keys_b, items_b, pos_b, 0, t, 0.0)
+    
+    # mu is the shortest s -> meet -> t distance seen so far.
+    mu = _INF
+    meet = -1
     nodes_explored = 0
+    if s == t:
+        # Settled without a pop; counted like dijkstra/astar count it.
+        mu = 0.0
+        meet = s
+        nodes_explored = 1
     
-    while priority_queue:
-        current_distance, current_node = heapq.heappop(priority_queue)
-        
-        if current_node in visited:
-            continue
+    while size_f > 0 and size_b > 0:
+        # No unsettled node on either side can close a shorter path.
+        if keys_f[0] + keys_b[0] >= mu:
+            break
         
-        visited.add(current_node)
+        if keys_f[0] <= keys_b[0]:
+            d, u, size_f = _pop_min(keys_f, items_f, pos_f, size_f)
+            nodes_explored += 1
+            
+            for k in range(indptr[u], indptr[u + 1]):
+                v = indices[k]
+                if pos_f[v] == _SETTLED:
+                    continue
+                
+                distance = d + weights[k]
+                if distance < dist_f[v]:
+                    dist_f[v] = distance
+                    prev_f[v] = u
+                    size_f = _push_or_decrease(keys_f, items_f, pos_f, size_f, v, distance)
+                    if distance + dist_b[v] < mu:
+                        mu = distance + dist_b[v]
+                        meet = v
+        else:
+            d, u, size_b = _pop_min(keys_b, items_b, pos_b, size_b)
+            nodes_explored += 1
+            
+            for k in range(rindptr[u], rindptr[u + 1]):
+                v = rindices[k]
+                if pos_b[v] == _SETTLED:
+                    continue
+                
+                distance = d + rweights[k]
+                if distance < dist_b[v]:
+                    dist_b[v] = distance
+                    next_b[v] = u
+                    size_b = _push_or_decrease(keys_b, items_b, pos_b, size_b, v, distance)
+                    if dist_f[v] + distance < mu:
+                        mu = dist_f[v] + distance
+                        meet = v
+    
+    return mu, prev_f, next_b, meet, nodes_explored
+
+
+# Goal coordinates are hoisted by the caller; inlining keeps these free of call
+# overhead inside the relaxation loop.
+@njit(cache=True, inline='always')
+def _euclidean_nb(x, y, gx, gy):
+    dx = x - gx
+    dy = y - gy
+    return (dx * dx + dy * dy) ** 0.5
+
+
+@njit(cache=True, inline='always')
+def _manhattan_nb(x, y, gx, gy):
+    return abs(x - gx) + abs(y - gy)
+
+
+@njit(cache=True, nogil=True, fastmath=_FASTMATH)
+def _astar_euclid_nb(indptr, indices, weights, xy, n, s, t):
+    g_score = np.full(n, _INF)
+    prev = np.full(n, -1, dtype=np.int32)
+    h_cache = np.full(n, _INF)
+    gx = xy[t, 0]
+    gy = xy[t, 1]
+    
+    # Each node sits in the heap at most once; improvements decrease its key.
+    keys = np.empty(n, dtype=np.float64)
+    items = np.empty(n, dtype=np.int32)
+    pos = np.full(n, _UNSEEN, dtype=np.int32)
+    g_score[s] = 0.0
+    size = _push_or_decrease(keys, items, pos, 0, s, 0.0)
+    nodes_explored = 0
+    
+    while size > 0:
+        _, u, size = _pop_min(keys, items, pos, size)
         nodes_explored += 1
         
-        if current_node == end:
-            break
+        if u == t:
+            return g_score[t], prev, nodes_explored
+        
+        for k in range(indptr[u], indptr[u + 1]):
+            v = indices[k]
+            if pos[v] == _SETTLED:
+                continue
+            
+            tentative_g = g_score[u] + weights[k]
+            
+            if tentative_g < g_score[v]:
+                prev[v] = u
+                g_score[v] = tentative_g
+                
+                h = h_cache[v]
+                if h == _INF:
+                    h = _euclidean_nb(xy[v, 0], xy[v, 1], gx, gy)
+                    h_cache[v] = h
+                
+                size = _push_or_decrease(keys, items, pos, size, v, tentative_g + h)
+    
+    return _INF, prev, nodes_explored
+
+
+@njit(cache=True, nogil=True, fastmath=_FASTMATH)
+def _astar_manhattan_nb(indptr, indices, weights, xy, n, s, t):
+    g_score = np.full(n, _INF)
+    prev = np.full(n, -1, dtype=np.int32)
+    gx = xy[t, 0]
+    gy = xy[t, 1]
+    
+    keys = np.empty(n, dtype=np.float64)
+    items = np.empty(n, dtype=np.int32)
+    pos = np.full(n, _UNSEEN, dtype=np.int32)
+    g_score[s] = 0.0
+    size = _push_or_decrease(keys, items, pos, 0, s, 0.0)
+    nodes_explored = 0
+    
+    while size > 0:
+        _, u, size = _pop_min(keys, items, pos, size)
+        nodes_explored += 1
         
-        if current_distance > distances[current_node]:
-            continue
+        if u == t:
+            return g_score[t], prev, nodes_explored
         
-        for neighbor, weight in graph.get_neighbors(current_node):
-            distance = current_distance + weight
+        for k in range(indptr[u], indptr[u + 1]):
+            v = indices[k]
+            if pos[v] == _SETTLED:
+                continue
             
-            if distance < distances[neighbor]:
-                distances[neighbor] = distance
-                previous[neighbor] = current_node
-                heapq.heappush(priority_queue, (distance, neighbor))
+            tentative_g = g_score[u] + weights[k]
+            
+            if tentative_g < g_score[v]:
+                prev[v] = u
+                g_score[v] = tentative_g
+                
+                # Cheaper to recompute than to memoize: two subtractions and two abs.
+                h = _manhattan_nb(xy[v, 0], xy[v, 1], gx, gy)
+                size = _push_or_decrease(keys, items, pos, size, v, tentative_g + h)
+    
+    return _INF, prev, nodes_explored
+
+
+@njit(cache=True, nogil=True)
+def _walk_previous(prev, t):
+    length = 0
+    current = t
+    while current != -1:
+        length += 1
+        current = prev[current]
+    
+    path = np.empty(length, dtype=np.int32)
+    current = t
+    for i in range(length - 1, -1, -1):
+        path[i] = current
+        current = prev[current]
+    return path
+
+
+@njit(cache=True, nogil=True)
+def _join_at_meeting(prev_f, next_b, meet):
+    head = _walk_previous(prev_f, meet)
+    length = len(head)
+    current = next_b[meet]
+    while current != -1:
+        length += 1
+        current = next_b[current]
+    
+    path = np.empty(length, dtype=np.int32)
+    path[:len(head)] = head
+    i = len(head)
+    current = next_b[meet]
+    while current != -1:
+        path[i] = current
+        i += 1
+        current = next_b[current]
+    return path
+
+
+def _reconstruct_path(graph: Graph, previous: np.ndarray, end_index: int) -> List[str]:
+    id_by_index = graph.id_by_index
+    return [id_by_index[index] for index in _walk_previous(previous, end_index).tolist()]
+
+
+def dijkstra(
+    graph: Graph,
+    start: str,
+    end: str,
+    output: str = "full"
+) -> Optional[Union[PathResult, DistanceResult]]:
+    start_time = time.perf_counter()
+    
+    if start not in graph.index_by_id or end not in graph.index_by_id:
+        return None
+    
+    graph.finalize()
+    end_index = graph.index_by_id[end]
     
-    if distances[end] == float('inf'):
+    distance, previous, nodes_explored = _dijkstra_nb(
+        graph.indptr,
+        graph.indices,
+        graph.weights,
+        len(graph.id_by_index),
+        graph.index_by_id[start],
+        end_index
+    )
+    
+    if distance == float('inf'):
         return None
     
-    path = []
-    current = end
-    while current is not None:
-        path.append(current)
-        current = previous[current]
-    path.reverse()
+    # Callers that only want the length skip path reconstruction entirely.
+    if output == "distance":
+        execution_time = (time.perf_counter() - start_time) * 1000
+        return float(distance), nodes_explored, round(execution_time, 4)
+    
+    path = _reconstruct_path(graph, previous, end_index)
     
     execution_time = (time.perf_counter() - start_time) * 1000
     
     return PathResult(
         path=path,
-        distance=distances[end],
+        distance=float(distance),
         nodes_explored=nodes_explored,
         execution_time_ms=round(execution_time, 4),
         algorithm="dijkstra"
     )
 
 
-def euclidean_heuristic(graph: Graph, node: str, goal: str) -> float:
-    if node not in graph.node_positions or goal not in graph.node_positions:
-        return 0
+def bidijkstra(
+    graph: Graph,
+    start: str,
+    end: str,
+    output: str = "full"
+) -> Optional[Union[PathResult, DistanceResult]]:
+    """Dijkstra run from both ends at once, stopping when the frontiers meet.
     
-    x1, y1 = graph.node_positions[node]
-    x2, y2 = graph.node_positions[goal]
-    return ((x2 - x1) ** 2 + (y2 - y1) ** 2) ** 0.5
-
-
-def manhattan_heuristic(graph: Graph, node: str, goal: str) -> float:
-    if node not in graph.node_positions or goal not in graph.node_positions:
-        return 0
+    Settles roughly half as many nodes as :func:`dijkstra` on long paths;
+    directed edges are followed backwards from ``end``.
+    """
+    start_time = time.perf_counter()
+    
+    if start not in graph.index_by_id or end not in graph.index_by_id:
+        return None
+    
+    graph.finalize()
+    
+    distance, prev_f, next_b, meet, nodes_explored = _bidijkstra_nb(
+        graph.indptr,
+        graph.indices,
+        graph.weights,
+        graph.rindptr,
+        graph.rindices,
+        graph.rweights,
+        len(graph.id_by_index),
+        graph.index_by_id[start],
+        graph.index_by_id[end]
+    )
+    
+    if distance == float('inf'):
+        return None
     
-    x1, y1 = graph.node_positions[node]
-    x2, y2 = graph.node_positions[goal]
-    return abs(x2 - x1) + abs(y2 - y1)
+    if output == "distance":
+        execution_time = (time.perf_counter() - start_time) * 1000
+        return float(distance), nodes_explored, round(execution_time, 4)
+    
+    id_by_index = graph.id_by_index
+    path = [id_by_index[index] for index in _join_at_meeting(prev_f, next_b, meet).tolist()]
+    
+    execution_time = (time.perf_counter() - start_time) * 1000
+    
+    return PathResult(
+        path=path,
+        distance=float(distance),
+        nodes_explored=nodes_explored,
+        execution_time_ms=round(execution_time, 4),
+        algorithm="bidijkstra"
+    )
 
 
 def astar(
     graph: Graph,
     start: str,
     end: str,
-    heuristic: str = "euclidean"
-) -> Optional[PathResult]:
+    heuristic: str = "euclidean",
+    output: str = "full"
+) -> Optional[Union[PathResult, DistanceResult]]:
     start_time = time.perf_counter()
     
-    if start not in graph.adjacency_list or end not in graph.adjacency_list:
+    if start not in graph.index_by_id or end not in graph.index_by_id:
         return None
     
-    heuristic_fn: Callable[[Graph, str, str], float]
+    graph.finalize()
+    end_index = graph.index_by_id[end]
+    
+    # One kernel per heuristic so the estimate is straight-line code in the loop.
     if heuristic == "manhattan":
-        heuristic_fn = manhattan_heuristic
+        kernel = _astar_manhattan_nb
     else:
-        heuristic_fn = euclidean_heuristic
+        kernel = _astar_euclid_nb
     
-    g_score: Dict[str, float] = {node: float('inf') for node in graph.adjacency_list}
-    g_score[start] = 0
+    distance, previous, nodes_explored = kernel(
+        graph.indptr,
+        graph.indices,
+        graph.weights,
+        graph.xy,
+        len(graph.id_by_index),
+        graph.index_by_id[start],
+        end_index
+    )
     
-    f_score: Dict[str, float] = {node: float('inf') for node in graph.adjacency_list}
-    f_score[start] = heuristic_fn(graph, start, end)
+    if distance == float('inf'):
+        return None
     
-    previous: Dict[str, Optional[str]] = {node: None for node in graph.adjacency_list}
+    if output == "distance":
+        execution_time = (time.perf_counter() - start_time) * 1000
+        return float(distance), nodes_explored, round(execution_time, 4)
     
-    open_set: List[Tuple[float, str]] = [(f_score[start], start)]
-    open_set_hash = {start}
-    closed_set = set()
-    nodes_explored = 0
+    path = _reconstruct_path(graph, previous, end_index)
     
-    while open_set:
-        _, current = heapq.heappop(open_set)
-        
-        if current not in open_set_hash:
-            continue
-        
-        open_set_hash.discard(current)
-        nodes_explored += 1
-        
-        if current == end:
-            path = []
-            while current is not None:
-                path.append(current)
-                current = previous[current]
-            path.reverse()
-            
-            execution_time = (time.perf_counter() - start_time) * 1000
-            
-            return PathResult(
-                path=path,
-                distance=g_score[end],
-                nodes_explored=nodes_explored,
-                execution_time_ms=round(execution_time, 4),
-                algorithm=f"astar_{heuristic}"
-            )
-        
-        closed_set.add(current)
-        
-        for neighbor, weight in graph.get_neighbors(current):
-            if neighbor in closed_set:
-                continue
-            
-            tentative_g = g_score[current] + weight
-            
-            if tentative_g < g_score[neighbor]:
-                previous[neighbor] = current
-                g_score[neighbor] = tentative_g
-                f_score[neighbor] = tentative_g + heuristic_fn(graph, neighbor, end)
-                
-                if neighbor not in open_set_hash:
-                    heapq.heappush(open_set, (f_score[neighbor], neighbor))
-                    open_set_hash.add(neighbor)
+    execution_time = (time.perf_counter() - start_time) * 1000
     
-    return None
+    return PathResult(
+        path=path,
+        distance=float(distance),
+        nodes_explored=nodes_explored,
+        execution_time_ms=round(execution_time, 4),
+        algorithm=f"astar_{heuristic}"
+    )
+
+
+def _warm_up():
+    # Load (or compile, on a cold cache) every kernel at import time so the
+    # first request does not pay for it; preloaded server workers inherit them.
+    graph = Graph()
+    graph.add_edge("a", "b", 1.0)
+    dijkstra(graph, "a", "b")
+    bidijkstra(graph, "a", "b")
+    astar(graph, "a", "b", "euclidean")
+    astar(graph, "a", "b", "manhattan")
+
+
+_warm_up()
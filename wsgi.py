@@ -0,0 +1,3 @@
+from app import app
+
+# Production entry point, e.g.: gunicorn -w 4 --preload -b 0.0.0.0:5000 wsgi:app